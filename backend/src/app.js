@@ -5,6 +5,7 @@ import express from 'express';
 import cors from 'cors';
 import helmet from 'helmet';
 import morgan from 'morgan';
+import compression from 'compression';
 import { createServer } from 'http';
 import dotenv from 'dotenv';
 import rateLimit from 'express-rate-limit';
@@ -73,6 +74,9 @@ const corsOptions = {
 
 app.use(cors(corsOptions));
 
+// Gzip JSON responses; GeoJSON payloads compress well
+app.use(compression());
+
 // Logging
 if (process.env.NODE_ENV === 'production') {
   app.use(morgan('combined'));
@@ -228,6 +228,19 @@ export const getDashboard = async (req, res) => {
     console.log(`📊 Building comprehensive dashboard for ${city}, ${country}...`);
     const currentData = await directDataService.getCityData(city, country);
 
+    // Tally hotspots and alerts in a single pass each
+    const hotspotsBySeverity = { critical: 0, high: 0, moderate: 0 };
+    const hotspotsByPollutant = { pm25: 0, no2: 0 };
+    currentData.hotspots.forEach(({ properties }) => {
+      if (Object.hasOwn(hotspotsBySeverity, properties.severity)) hotspotsBySeverity[properties.severity]++;
+      if (properties.pollutant === 'PM2.5') hotspotsByPollutant.pm25++;
+      else if (properties.pollutant === 'NO2') hotspotsByPollutant.no2++;
+    });
+    const alertsBySeverity = { critical: 0, high: 0, medium: 0 };
+    currentData.alerts.forEach(({ severity }) => {
+      if (Object.hasOwn(alertsBySeverity, severity)) alertsBySeverity[severity]++;
+    });
+
     const dashboard = {
       timestamp: new Date().toISOString(),
       location: `${city}, ${country}`,
@@ -251,23 +264,12 @@ export const getDashboard = async (req, res) => {
       },
       hotspots_summary: {
         total: currentData.hotspots.length,
-        by_severity: {
-          critical: currentData.hotspots.filter(h => h.properties.severity === 'critical').length,
-          high: currentData.hotspots.filter(h => h.properties.severity === 'high').length,
-          moderate: currentData.hotspots.filter(h => h.properties.severity === 'moderate').length
-        },
-        by_pollutant: {
-          pm25: currentData.hotspots.filter(h => h.properties.pollutant === 'PM2.5').length,
-          no2: currentData.hotspots.filter(h => h.properties.pollutant === 'NO2').length
-        }
+        by_severity: hotspotsBySeverity,
+        by_pollutant: hotspotsByPollutant
       },
       alerts_summary: {
         total: currentData.alerts.length,
-        by_severity: {
-          critical: currentData.alerts.filter(a => a.severity === 'critical').length,
-          high: currentData.alerts.filter(a => a.severity === 'high').length,
-          medium: currentData.alerts.filter(a => a.severity === 'medium').length
-        },
+        by_severity: alertsBySeverity,
         latest_alert: currentData.alerts[0] || null
       },
       data_health: {
@@ -1,7 +1,11 @@
+import NodeCache from 'node-cache';
 import directDataService from '../services/directDataService.js';
 import { generateAPIRecommendations } from '../utils/apiUtils.js';
 import { io } from '../websocket/realtime.js';
 
+// Short-lived cache so repeated connectivity checks don't re-probe every upstream API
+const apiTestCache = new NodeCache({ stdTTL: 30 });
+
 // Enhanced health check
 export const getHealth = async (req, res) => {
   try {
@@ -53,6 +57,7 @@ export const getHealth = async (req, res) => {
 export const clearCache = (req, res) => {
   try {
     directDataService.clearCache();
+    apiTestCache.flushAll();
     res.json({
       success: true,
       message: 'Cache cleared successfully',
@@ -69,6 +74,11 @@ export const clearCache = (req, res) => {
 // Test API connectivity
 export const testApis = async (req, res) => {
   try {
+    const cached = apiTestCache.get('results');
+    if (cached) {
+      return res.json(cached);
+    }
+
     console.log('🧪 Testing API connectivity...');
 
     const testResults = {
@@ -78,57 +88,52 @@ export const testApis = async (req, res) => {
       waqi: false
     };
 
-    // Test WeatherAPI
-    if (process.env.WEATHERAPI_KEY) {
+    const probe = async (name, label, url, options = {}) => {
       try {
-        const response = await fetch(
-          `https://api.weatherapi.com/v1/current.json?key=${process.env.WEATHERAPI_KEY}&q=Nairobi,KE&aqi=yes`,
-          { timeout: 5000 }
-        );
-        testResults.weatherapi = response.ok;
+        const response = await fetch(url, { ...options, timeout: 5000 });
+        testResults[name] = response.ok;
       } catch (error) {
-        console.warn('WeatherAPI test failed:', error.message);
+        console.warn(`${label} test failed:`, error.message);
       }
-    }
+    };
+
+    // Probe all APIs concurrently so the check takes as long as the slowest one
+    const probes = [];
 
-    // Test OpenAQ
-    try {
-      const headers = process.env.OPENAQ_API_KEY ? { 'X-API-Key': process.env.OPENAQ_API_KEY } : {};
-      const response = await fetch(
-        'https://api.openaq.org/v2/latest?country=KE&limit=1',
-        { headers, timeout: 5000 }
-      );
-      testResults.openaq = response.ok;
-    } catch (error) {
-      console.warn('OpenAQ test failed:', error.message);
+    if (process.env.WEATHERAPI_KEY) {
+      probes.push(probe(
+        'weatherapi',
+        'WeatherAPI',
+        `https://api.weatherapi.com/v1/current.json?key=${process.env.WEATHERAPI_KEY}&q=Nairobi,KE&aqi=yes`
+      ));
     }
 
-    // Test IQAir
+    const openaqHeaders = process.env.OPENAQ_API_KEY ? { 'X-API-Key': process.env.OPENAQ_API_KEY } : {};
+    probes.push(probe(
+      'openaq',
+      'OpenAQ',
+      'https://api.openaq.org/v2/latest?country=KE&limit=1',
+      { headers: openaqHeaders }
+    ));
+
     if (process.env.IQAIR_API_KEY) {
-      try {
-        const response = await fetch(
-          `https://api.airvisual.com/v2/nearest_city?lat=-1.2921&lon=36.8219&key=${process.env.IQAIR_API_KEY}`,
-          { timeout: 5000 }
-        );
-        testResults.iqair = response.ok;
-      } catch (error) {
-        console.warn('IQAir test failed:', error.message);
-      }
+      probes.push(probe(
+        'iqair',
+        'IQAir',
+        `https://api.airvisual.com/v2/nearest_city?lat=-1.2921&lon=36.8219&key=${process.env.IQAIR_API_KEY}`
+      ));
     }
 
-    // Test WAQI
     if (process.env.WAQI_TOKEN) {
-      try {
-        const response = await fetch(
-          `https://api.waqi.info/feed/nairobi/?token=${process.env.WAQI_TOKEN}`,
-          { timeout: 5000 }
-        );
-        testResults.waqi = response.ok;
-      } catch (error) {
-        console.warn('WAQI test failed:', error.message);
-      }
+      probes.push(probe(
+        'waqi',
+        'WAQI',
+        `https://api.waqi.info/feed/nairobi/?token=${process.env.WAQI_TOKEN}`
+      ));
     }
 
+    await Promise.all(probes);
+
     const workingAPIs = Object.values(testResults).filter(Boolean).length;
     const totalConfigured = Object.entries(testResults).filter(([key, _]) => {
       const envVars = {
@@ -140,7 +145,7 @@ export const testApis = async (req, res) => {
       return envVars[key];
     }).length;
 
-    res.json({
+    const results = {
       success: workingAPIs > 0,
       apis_tested: testResults,
       summary: {
@@ -150,7 +155,10 @@ export const testApis = async (req, res) => {
       },
       recommendations: generateAPIRecommendations(testResults),
       timestamp: new Date().toISOString()
-    });
+    };
+
+    apiTestCache.set('results', results);
+    res.json(results);
 
   } catch (error) {
     console.error('❌ API test error:', error);
@@ -4,6 +4,27 @@
 import axios from 'axios';
 import NodeCache from 'node-cache';
 
+// Patterns used to strip markdown fences from model output
+const CODE_FENCE_PATTERN = /```(?:json)?\n?/g;
+const BLANK_LINE_PATTERN = /^\s*[\r\n]/gm;
+
+// Recommendation scoring tables, shared across calls
+const IMPLEMENTATION_PRIORITY = Object.freeze({
+  'immediate': 4,
+  'short_term': 3,
+  'medium_term': 2,
+  'long_term': 1
+});
+
+const IMPACT_ESTIMATES = Object.freeze({
+  'monitoring': Object.freeze({ improvement: '10-20%', timeframe: '6-12 months' }),
+  'traffic': Object.freeze({ improvement: '15-30%', timeframe: '3-6 months' }),
+  'industrial': Object.freeze({ improvement: '20-40%', timeframe: '6-18 months' }),
+  'health': Object.freeze({ improvement: '5-15%', timeframe: 'immediate to 3 months' })
+});
+
+const DEFAULT_IMPACT_ESTIMATE = Object.freeze({ improvement: '5-15%', timeframe: '6-12 months' });
+
 class AIPolicyService {
   constructor() {
     this.cache = new NodeCache({ stdTTL: 900 }); // 15 minutes cache
@@ -652,9 +673,8 @@ Provide recommendations in JSON format:
   cleanJSONResponse(response) {
     // Remove markdown formatting and extract JSON
     return response
-      .replace(/```json\n?/g, '')
-      .replace(/```\n?/g, '')
-      .replace(/^\s*[\r\n]/gm, '')
+      .replace(CODE_FENCE_PATTERN, '')
+      .replace(BLANK_LINE_PATTERN, '')
       .trim();
   }
 
@@ -805,7 +825,8 @@ Provide recommendations in JSON format:
     if (!satelliteData || !satelliteData.processed_data) return 'stable';
 
     const hotspots = satelliteData.processed_data.pollution_hotspots || [];
-    const recentHotspots = hotspots.filter(h => h.properties.timestamp && new Date(h.properties.timestamp) > new Date(Date.now() - 24 * 60 * 60 * 1000));
+    const cutoff = Date.now() - 24 * 60 * 60 * 1000;
+    const recentHotspots = hotspots.filter(h => h.properties.timestamp && new Date(h.properties.timestamp).getTime() > cutoff);
 
     if (recentHotspots.length > hotspots.length * 0.75) return 'increasing';
     if (recentHotspots.length < hotspots.length * 0.25) return 'decreasing';
@@ -975,25 +996,11 @@ Provide recommendations in JSON format:
   }
 
   calculateImplementationPriority(recommendation) {
-    const priorityMap = {
-      'immediate': 4,
-      'short_term': 3,
-      'medium_term': 2,
-      'long_term': 1
-    };
-
-    return priorityMap[recommendation.implementation.timeline] || 2;
+    return IMPLEMENTATION_PRIORITY[recommendation.implementation.timeline] || 2;
   }
 
   estimateImpact(recommendation, currentConditions) {
-    const impactEstimates = {
-      'monitoring': { improvement: '10-20%', timeframe: '6-12 months' },
-      'traffic': { improvement: '15-30%', timeframe: '3-6 months' },
-      'industrial': { improvement: '20-40%', timeframe: '6-18 months' },
-      'health': { improvement: '5-15%', timeframe: 'immediate to 3 months' }
-    };
-
-    return impactEstimates[recommendation.category] || { improvement: '5-15%', timeframe: '6-12 months' };
+    return IMPACT_ESTIMATES[recommendation.category] || DEFAULT_IMPACT_ESTIMATE;
   }
 
   extractContextFactors(currentConditions, predictions) {
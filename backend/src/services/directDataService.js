@@ -5,6 +5,15 @@ import axios from 'axios';
 import NodeCache from 'node-cache';
 import aiPolicyService from './aiPolicyService.js';
 
+// WeatherAPI sample points around a city centre: [area, lat offset, lon offset]
+const WEATHER_SAMPLE_POINTS = [
+  ['CBD', 0, 0],
+  ['West', 0.02, -0.02],
+  ['East', 0.02, 0.02],
+  ['North', -0.02, 0],
+  ['South', 0.02, 0]
+];
+
 class DirectDataService {
   constructor() {
     // Cache for 15 minutes to avoid excessive API calls
@@ -218,19 +227,13 @@ async enhanceWithAIInsights(data, city, country) {
     }
  
     const coords = this.getCityCoordinates(city, country);
-    const coordString = `${coords.lat},${coords.lon}`;
-    
-    const locations = [
-      { name: `${city} CBD`, coords: coordString },
-      { name: `${city} West`, coords: this.getNearbyCoords(coordString, 0.02, -0.02) },
-      { name: `${city} East`, coords: this.getNearbyCoords(coordString, 0.02, 0.02) },
-      { name: `${city} North`, coords: this.getNearbyCoords(coordString, -0.02, 0) },
-      { name: `${city} South`, coords: this.getNearbyCoords(coordString, 0.02, 0) }
-    ];
+    const locations = WEATHER_SAMPLE_POINTS.map(([area, latOffset, lonOffset]) => ({
+      name: `${city} ${area}`,
+      coords: this.getNearbyCoords(coords, latOffset, lonOffset)
+    }));
 
-    const results = [];
-    
-    for (const location of locations) {
+    // Query all sample points concurrently; five requests stay well within rate limits
+    const settled = await Promise.allSettled(locations.map(async (location) => {
       try {
         const response = await axios.get(
           `https://api.weatherapi.com/v1/current.json`,
@@ -245,7 +248,7 @@ async enhanceWithAIInsights(data, city, country) {
         );
         
         const data = response.data;
-        results.push({
+        return {
           location: location.name,
           coordinates: {
             lat: data.location.lat,
@@ -271,16 +274,17 @@ async enhanceWithAIInsights(data, city, country) {
           source: 'WeatherAPI.com',
           quality: 'premium',
           timestamp: new Date().toISOString()
-        });
-        
-        // Small delay to avoid rate limiting
-        await new Promise(resolve => setTimeout(resolve, 200));
-        
+        };
       } catch (error) {
         console.warn(`⚠️ WeatherAPI failed for ${location.name}:`, error.message);
-        // Continue with other locations even if one fails
+        // Rejected points are dropped below by allSettled; other locations still count
+        throw error;
       }
-    }
+    }));
+
+    const results = settled
+      .filter(result => result.status === 'fulfilled')
+      .map(result => result.value);
     
     return results.length > 0 ? results : null;
   }
@@ -396,6 +400,9 @@ async enhanceWithAIInsights(data, city, country) {
   // 🔄 Process all measurements into unified format
   processMeasurements(weatherData, openaqData, iqairData, waqiData) {
     const measurements = [];
+    // One timestamp per batch; ids stay unique through the random suffix
+    const batchTime = Date.now();
+    const batchTimestamp = new Date(batchTime).toISOString();
     
     // Process WeatherAPI data
     if (weatherData.status === 'fulfilled' && weatherData.value) {
@@ -403,7 +410,7 @@ async enhanceWithAIInsights(data, city, country) {
         if (!station) return;
         
         measurements.push({
-          id: `weather_${Date.now()}_${Math.random().toString(36).substr(2, 5)}`,
+          id: `weather_${batchTime}_${Math.random().toString(36).substr(2, 5)}`,
           type: 'Feature',
           geometry: {
             type: 'Point',
@@ -433,7 +440,7 @@ async enhanceWithAIInsights(data, city, country) {
     if (iqairData.status === 'fulfilled' && iqairData.value) {
       const station = iqairData.value;
       measurements.push({
-        id: `iqair_${Date.now()}_${Math.random().toString(36).substr(2, 5)}`,
+        id: `iqair_${batchTime}_${Math.random().toString(36).substr(2, 5)}`,
         type: 'Feature',
         geometry: {
           type: 'Point',
@@ -456,7 +463,7 @@ async enhanceWithAIInsights(data, city, country) {
     if (waqiData.status === 'fulfilled' && waqiData.value) {
       waqiData.value.forEach(station => {
         measurements.push({
-          id: `waqi_${Date.now()}_${Math.random().toString(36).substr(2, 5)}`,
+          id: `waqi_${batchTime}_${Math.random().toString(36).substr(2, 5)}`,
           type: 'Feature',
           geometry: {
             type: 'Point',
@@ -471,7 +478,7 @@ async enhanceWithAIInsights(data, city, country) {
             no2: station.measurements?.no2?.v,
             o3: station.measurements?.o3?.v,
             quality: station.quality,
-            timestamp: station.time?.s || new Date().toISOString()
+            timestamp: station.time?.s || batchTimestamp
           }
         });
       });
@@ -492,42 +499,54 @@ async enhanceWithAIInsights(data, city, country) {
       };
     }
     
-    const pm25Values = measurements
-      .map(m => m.properties.pm25)
-      .filter(pm25 => pm25 != null && !isNaN(pm25));
-    
-    const no2Values = measurements
-      .map(m => m.properties.no2)
-      .filter(no2 => no2 != null && !isNaN(no2));
+    // Accumulate count/sum/min/max per pollutant in a single pass over the measurements
+    const stats = {
+      pm25: { count: 0, sum: 0, min: Infinity, max: -Infinity, unhealthy: 0 },
+      no2: { count: 0, sum: 0, min: Infinity, max: -Infinity },
+      o3: { count: 0, sum: 0, min: Infinity, max: -Infinity }
+    };
+    const sources = new Set();
+    
+    for (const m of measurements) {
+      sources.add(m.properties.source);
+      for (const pollutant of ['pm25', 'no2', 'o3']) {
+        const value = m.properties[pollutant];
+        if (value == null || isNaN(value)) continue;
+        const s = stats[pollutant];
+        s.count++;
+        s.sum += value;
+        if (value < s.min) s.min = value;
+        if (value > s.max) s.max = value;
+      }
+      if (m.properties.pm25 > 35) stats.pm25.unhealthy++;
+    }
     
-    const o3Values = measurements
-      .map(m => m.properties.o3)
-      .filter(o3 => o3 != null && !isNaN(o3));
+    const round1 = value => Math.round(value * 10) / 10;
     
     const summary = {
       total_measurements: measurements.length,
-      active_sources: [...new Set(measurements.map(m => m.properties.source))],
+      active_sources: [...sources],
       spatial_coverage: this.calculateSpatialCoverage(measurements),
       last_update: new Date().toISOString()
     };
     
-    if (pm25Values.length > 0) {
-      summary.avg_pm25 = Math.round((pm25Values.reduce((sum, val) => sum + val, 0) / pm25Values.length) * 10) / 10;
-      summary.max_pm25 = Math.round(Math.max(...pm25Values) * 10) / 10;
-      summary.min_pm25 = Math.round(Math.min(...pm25Values) * 10) / 10;
+    if (stats.pm25.count > 0) {
+      summary.avg_pm25 = round1(stats.pm25.sum / stats.pm25.count);
+      summary.max_pm25 = round1(stats.pm25.max);
+      summary.min_pm25 = round1(stats.pm25.min);
       summary.aqi = this.calculateAQI(summary.avg_pm25);
       summary.air_quality_status = this.getAQICategory(summary.aqi);
-      summary.unhealthy_readings = pm25Values.filter(pm25 => pm25 > 35).length;
+      summary.unhealthy_readings = stats.pm25.unhealthy;
     }
     
-    if (no2Values.length > 0) {
-      summary.avg_no2 = Math.round((no2Values.reduce((sum, val) => sum + val, 0) / no2Values.length) * 10) / 10;
-      summary.max_no2 = Math.round(Math.max(...no2Values) * 10) / 10;
+    if (stats.no2.count > 0) {
+      summary.avg_no2 = round1(stats.no2.sum / stats.no2.count);
+      summary.max_no2 = round1(stats.no2.max);
     }
     
-    if (o3Values.length > 0) {
-      summary.avg_o3 = Math.round((o3Values.reduce((sum, val) => sum + val, 0) / o3Values.length) * 10) / 10;
-      summary.max_o3 = Math.round(Math.max(...o3Values) * 10) / 10;
+    if (stats.o3.count > 0) {
+      summary.avg_o3 = round1(stats.o3.sum / stats.o3.count);
+      summary.max_o3 = round1(stats.o3.max);
     }
     
     return summary;
@@ -536,6 +555,7 @@ async enhanceWithAIInsights(data, city, country) {
   // 🔥 Identify pollution hotspots
   identifyHotspots(measurements) {
     const hotspots = [];
+    const detectionTime = new Date().toISOString();
     
     measurements.forEach(measurement => {
       const pm25 = measurement.properties.pm25;
@@ -555,7 +575,7 @@ async enhanceWithAIInsights(data, city, country) {
             pollutant: 'PM2.5',
             source: measurement.properties.source,
             location_name: measurement.properties.name,
-            detection_time: new Date().toISOString()
+            detection_time: detectionTime
           }
         });
       }
@@ -573,7 +593,7 @@ async enhanceWithAIInsights(data, city, country) {
             pollutant: 'NO2',
             source: measurement.properties.source,
             location_name: measurement.properties.name,
-            detection_time: new Date().toISOString()
+            detection_time: detectionTime
           }
         });
       }
@@ -591,7 +611,7 @@ async enhanceWithAIInsights(data, city, country) {
             pollutant: 'O3',
             source: measurement.properties.source,
             location_name: measurement.properties.name,
-            detection_time: new Date().toISOString()
+            detection_time: detectionTime
           }
         });
       }
@@ -603,18 +623,20 @@ async enhanceWithAIInsights(data, city, country) {
   // 🚨 Generate real-time alerts
   generateAlerts(summary, hotspots) {
     const alerts = [];
+    const now = Date.now();
+    const timestamp = new Date(now).toISOString();
     
     // Air quality alerts based on PM2.5
     if (summary.avg_pm25 > 55) {
       alerts.push({
-        id: `alert_pm25_${Date.now()}`,
+        id: `alert_pm25_${now}`,
         type: 'health_emergency',
         severity: 'critical',
         message: `Very unhealthy air quality: PM2.5 at ${summary.avg_pm25} μg/m³`,
         threshold: 55,
         current_value: summary.avg_pm25,
         affected_area: 'City-wide',
-        timestamp: new Date().toISOString(),
+        timestamp,
         actions: [
           'Stay indoors',
           'Avoid outdoor activities',
@@ -624,14 +646,14 @@ async enhanceWithAIInsights(data, city, country) {
       });
     } else if (summary.avg_pm25 > 35) {
       alerts.push({
-        id: `alert_pm25_${Date.now()}`,
+        id: `alert_pm25_${now}`,
         type: 'air_pollution',
         severity: 'high',
         message: `Unhealthy air quality: PM2.5 at ${summary.avg_pm25} μg/m³`,
         threshold: 35,
         current_value: summary.avg_pm25,
         affected_area: 'City-wide',
-        timestamp: new Date().toISOString(),
+        timestamp,
         actions: [
           'Sensitive groups should limit outdoor activities',
           'Consider wearing masks outdoors',
@@ -643,14 +665,14 @@ async enhanceWithAIInsights(data, city, country) {
     // NO2 alerts
     if (summary.avg_no2 > 80) {
       alerts.push({
-        id: `alert_no2_${Date.now()}`,
+        id: `alert_no2_${now}`,
         type: 'air_pollution',
         severity: 'high',
         message: `Elevated nitrogen dioxide levels: NO2 at ${summary.avg_no2} μg/m³`,
         threshold: 80,
         current_value: summary.avg_no2,
         affected_area: 'City-wide',
-        timestamp: new Date().toISOString(),
+        timestamp,
         actions: [
           'Avoid strenuous outdoor activities',
           'Consider reducing vehicle usage',
@@ -663,12 +685,12 @@ async enhanceWithAIInsights(data, city, country) {
     const criticalHotspots = hotspots.filter(h => h.properties.severity === 'critical');
     if (criticalHotspots.length > 0) {
       alerts.push({
-        id: `hotspot_alert_${Date.now()}`,
+        id: `hotspot_alert_${now}`,
         type: 'pollution_hotspot',
         severity: 'high',
         message: `${criticalHotspots.length} critical pollution hotspot(s) detected`,
         hotspots: criticalHotspots.map(h => h.properties.location_name),
-        timestamp: new Date().toISOString()
+        timestamp
       });
     }
     
@@ -775,8 +797,7 @@ async enhanceWithAIInsights(data, city, country) {
     return 'Hazardous';
   }
 
-  getNearbyCoords(coords, latOffset, lonOffset) {
-    const [lat, lon] = coords.split(',').map(Number);
+  getNearbyCoords({ lat, lon }, latOffset, lonOffset) {
     return `${(lat + latOffset).toFixed(4)},${(lon + lonOffset).toFixed(4)}`;
   }
 
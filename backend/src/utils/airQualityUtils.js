@@ -1,13 +1,14 @@
+const AIR_QUALITY_EMOJI = Object.freeze({
+  'Good': '😊',
+  'Moderate': '😐',
+  'Unhealthy for Sensitive Groups': '😷',
+  'Unhealthy': '😨',
+  'Very Unhealthy': '🚨',
+  'Unknown': '❓'
+});
+
 export function getAirQualityEmoji(status) {
-  const emojiMap = {
-    'Good': '😊',
-    'Moderate': '😐',
-    'Unhealthy for Sensitive Groups': '😷',
-    'Unhealthy': '😨',
-    'Very Unhealthy': '🚨',
-    'Unknown': '❓'
-  };
-  return emojiMap[status] || '❓';
+  return AIR_QUALITY_EMOJI[status] || '❓';
 }
 
 export function getHealthMessage(pm25) {
@@ -4,6 +4,9 @@ import requests
 client_id = "sh-63424625-2356-478e-ba73-7bfb8cef591c"
 client_secret = "18pqj2jqnCaemVsdgmOLNbAlS8vuqPlp"
 
+# Reuse one session so the connection is kept alive across all requests
+session = requests.Session()
+
 # Step 1: Get authentication token
 print("Step 1: Getting authentication token...")
 token_url = "https://identity.dataspace.copernicus.eu/auth/realms/CDSE/protocol/openid-connect/token"
@@ -13,7 +16,7 @@ data = {
     "client_secret": client_secret
 }
 
-response = requests.post(token_url, data=data)
+response = session.post(token_url, data=data)
 if response.status_code != 200:
     print(f"Error getting token: {response.status_code} - {response.text}")
     exit(1)
@@ -40,8 +43,8 @@ params = {
     "$top": 1
 }
 
-headers = {"Authorization": f"Bearer {token}"}
-response = requests.get(catalogue_url, headers=headers, params=params)
+session.headers.update({"Authorization": f"Bearer {token}"})
+response = session.get(catalogue_url, params=params)
 
 if response.status_code != 200:
     print(f"Error searching products: {response.status_code} - {response.text}")
@@ -60,19 +63,17 @@ print(f"Found product: {product_name} (ID: {product_id})")
 print("\nStep 3: Downloading sample (first 1MB)...")
 download_url = f"https://catalogue.dataspace.copernicus.eu/odata/v1/Products({product_id})/$value"
 
-response = requests.get(download_url, headers=headers, stream=True)
-if response.status_code != 200:
+sample_size = 1024 * 1024  # Stop after 1MB
+
+# Ask for just the sample range; servers that ignore Range reply 200 and we cap the read
+response = session.get(download_url, headers={"Range": f"bytes=0-{sample_size - 1}"}, stream=True)
+if response.status_code not in (200, 206):
     print(f"Error downloading: {response.status_code} - {response.text}")
     exit(1)
 
+response.raw.decode_content = True
 with open("sample_product.nc", "wb") as f:
-    downloaded = 0
-    for chunk in response.iter_content(chunk_size=1024):
-        if chunk:  # filter out keep-alive chunks
-            f.write(chunk)
-            downloaded += len(chunk)
-            if downloaded > 1024 * 1024:  # Stop after 1MB
-                break
+    f.write(response.raw.read(sample_size))
 
 print("Download completed! Sample saved as 'sample_product.nc'")
 print("Script finished successfully!")
\ No newline at end of file
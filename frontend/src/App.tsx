@@ -1,13 +1,16 @@
-import React from 'react';
+import React, { Suspense, lazy } from 'react';
 import { BrowserRouter as Router, Routes, Route } from 'react-router-dom';
 import { Toaster } from 'react-hot-toast';
 import AirQualityDashboard from './components/Dashboard/AirQualityDashboard';
-import MapView from './components/Map/MapView';
-import Analytics from './components/Analytics/Analytics';
-import Alerts from './components/Alerts/Alerts';
-import Policy from './components/Policy/Policy';
+import PageLoader from './components/Common/PageLoader';
 import { SocketProvider } from './context/SocketContext';
 import { DataProvider } from './context/DataContext';
+
+// Leaflet and Recharts are only needed on these pages; split them out of the landing bundle
+const MapView = lazy(() => import('./components/Map/MapView'));
+const Analytics = lazy(() => import('./components/Analytics/Analytics'));
+const Alerts = lazy(() => import('./components/Alerts/Alerts'));
+const Policy = lazy(() => import('./components/Policy/Policy'));
 // import './App.css';
 
 function App() {
@@ -16,14 +19,16 @@ function App() {
       <SocketProvider>
         <DataProvider>
           <Router>
-            <Routes>
-              <Route path="/" element={<AirQualityDashboard />} />
-              <Route path="/dashboard" element={<AirQualityDashboard />} />
-              <Route path="/map" element={<MapView />} />
-              <Route path="/analytics" element={<Analytics />} />
-              <Route path="/alerts" element={<Alerts />} />
-              <Route path="/policy" element={<Policy />} />
-            </Routes>
+            <Suspense fallback={<PageLoader />}>
+              <Routes>
+                <Route path="/" element={<AirQualityDashboard />} />
+                <Route path="/dashboard" element={<AirQualityDashboard />} />
+                <Route path="/map" element={<MapView />} />
+                <Route path="/analytics" element={<Analytics />} />
+                <Route path="/alerts" element={<Alerts />} />
+                <Route path="/policy" element={<Policy />} />
+              </Routes>
+            </Suspense>
           </Router>
           <Toaster 
             position="top-right"
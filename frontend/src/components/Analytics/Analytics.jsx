@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import {
   LineChart,
   Line,
@@ -47,6 +47,12 @@ const Analytics = () => {
     sources: [],
     correlations: []
   });
+  // The correlation chart shows the latest 20 points; keep the same array between
+  // unrelated renders so Recharts doesn't replay its line animation each time
+  const recentCorrelations = useMemo(
+    () => analyticsData.correlations.slice(-20),
+    [analyticsData.correlations]
+  );
 
   useEffect(() => {
     processAnalyticsData();
@@ -88,7 +94,7 @@ const Analytics = () => {
         : time.toLocaleDateString();
       
       if (!acc[key]) {
-        acc[key] = { time: key, values: [], count: 0 };
+        acc[key] = { time: key, sortKey: time.getTime(), values: [], count: 0 };
       }
       
       const value = measurement.properties[selectedPollutant];
@@ -100,7 +106,10 @@ const Analytics = () => {
       return acc;
     }, {});
 
+    // Sort on the numeric timestamp captured while grouping; the display labels
+    // (e.g. "14:00") don't parse back into dates reliably
     return Object.values(grouped)
+      .sort((a, b) => a.sortKey - b.sortKey)
       .map(group => ({
         time: group.time,
         [selectedPollutant]: group.values.length 
@@ -108,7 +117,6 @@ const Analytics = () => {
           : 0,
         count: group.count
       }))
-      .sort((a, b) => new Date(a.time) - new Date(b.time))
       .slice(-20); // Last 20 data points
   };
 
@@ -128,11 +136,16 @@ const Analytics = () => {
           { name: 'Very High (60+)', min: 60, max: 1000, color: '#ef4444' }
         ];
 
-    const distribution = ranges.map(range => {
-      const count = data.filter(m => {
-        const value = m.properties[selectedPollutant];
-        return value >= range.min && value < range.max;
-      }).length;
+    // Bin every reading in a single pass instead of re-filtering per range
+    const counts = new Array(ranges.length).fill(0);
+    data.forEach(m => {
+      const value = m.properties[selectedPollutant];
+      const index = ranges.findIndex(range => value >= range.min && value < range.max);
+      if (index !== -1) counts[index]++;
+    });
+
+    const distribution = ranges.map((range, index) => {
+      const count = counts[index];
 
       return {
         name: range.name,
@@ -450,7 +463,7 @@ const Analytics = () => {
               Weather vs PM2.5 Correlation
             </h3>
             <ResponsiveContainer width="100%" height={250}>
-              <LineChart data={analyticsData.correlations.slice(-20)}>
+              <LineChart data={recentCorrelations}>
                 <CartesianGrid strokeDasharray="3 3" />
                 <XAxis dataKey="timestamp" tickFormatter={(value) => new Date(value).getHours() + ':00'} />
                 <YAxis yAxisId="left" />
@@ -0,0 +1,10 @@
+import React from 'react';
+
+// Fallback spinner for lazily loaded pages and dashboard tabs
+const PageLoader = () => (
+  <div className="flex items-center justify-center py-24">
+    <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-unep-primary"></div>
+  </div>
+);
+
+export default PageLoader;
@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { useMemo } from 'react';
 import { Line, Bar, Doughnut } from 'react-chartjs-2';
 import {
   Chart as ChartJS,
@@ -29,107 +29,119 @@ ChartJS.register(
   Filler
 );
 
+// Shared chart styling; only the title varies per chart
+const FONT_FAMILY = "'Inter', sans-serif";
+
+const BASE_PLUGINS = {
+  legend: {
+    position: 'top',
+    labels: {
+      usePointStyle: true,
+      boxWidth: 6,
+      font: {
+        family: FONT_FAMILY,
+        size: 12
+      }
+    }
+  },
+  tooltip: {
+    backgroundColor: 'rgba(255, 255, 255, 0.9)',
+    titleColor: '#374151',
+    bodyColor: '#374151',
+    borderColor: '#e5e7eb',
+    borderWidth: 1,
+    padding: 12,
+    cornerRadius: 8,
+    titleFont: {
+      family: FONT_FAMILY,
+      size: 14,
+      weight: 'bold'
+    },
+    bodyFont: {
+      family: FONT_FAMILY,
+      size: 13
+    },
+    boxPadding: 6
+  }
+};
+
+const POLLUTANT_COLORS = {
+  pm25: {
+    primary: '#00857c',
+    secondary: 'rgba(0, 133, 124, 0.2)'
+  },
+  pm10: {
+    primary: '#0077c8',
+    secondary: 'rgba(0, 119, 200, 0.2)'
+  },
+  no2: {
+    primary: '#3f9c35',
+    secondary: 'rgba(63, 156, 53, 0.2)'
+  },
+  o3: {
+    primary: '#ffc72c',
+    secondary: 'rgba(255, 199, 44, 0.2)'
+  }
+};
+
+const POLLUTANT_LABELS = {
+  pm25: 'PM2.5 (μg/m³)',
+  pm10: 'PM10 (μg/m³)',
+  no2: 'NO₂ (μg/m³)',
+  o3: 'O₃ (μg/m³)'
+};
+
+const CATEGORY_COLORS = [
+  '#3f9c35', // Good - Green
+  '#ffc72c', // Moderate - Yellow
+  '#ff9933', // Unhealthy for Sensitive - Orange
+  '#cc0033', // Unhealthy - Red
+  '#660099'  // Very Unhealthy - Purple
+];
+
+// Get color based on pollutant type
+const getColor = (pollutant) => POLLUTANT_COLORS[pollutant] || POLLUTANT_COLORS.pm25;
+
+// Get pollutant label
+const getPollutantLabel = (pollutant) => POLLUTANT_LABELS[pollutant] || pollutant.toUpperCase();
+
 const AirQualityChart = ({ data, type = 'line', title, pollutant = 'pm25' }) => {
   // Default options for all chart types
-  const defaultOptions = {
+  const defaultOptions = useMemo(() => ({
     responsive: true,
     maintainAspectRatio: false,
     plugins: {
-      legend: {
-        position: 'top',
-        labels: {
-          usePointStyle: true,
-          boxWidth: 6,
-          font: {
-            family: "'Inter', sans-serif",
-            size: 12
-          }
-        }
-      },
+      ...BASE_PLUGINS,
       title: {
         display: !!title,
         text: title,
         font: {
-          family: "'Inter', sans-serif",
+          family: FONT_FAMILY,
           size: 16,
           weight: 'bold'
         }
-      },
-      tooltip: {
-        backgroundColor: 'rgba(255, 255, 255, 0.9)',
-        titleColor: '#374151',
-        bodyColor: '#374151',
-        borderColor: '#e5e7eb',
-        borderWidth: 1,
-        padding: 12,
-        cornerRadius: 8,
-        titleFont: {
-          family: "'Inter', sans-serif",
-          size: 14,
-          weight: 'bold'
-        },
-        bodyFont: {
-          family: "'Inter', sans-serif",
-          size: 13
-        },
-        boxPadding: 6
       }
     }
-  };
+  }), [title]);
 
-  // Get color based on pollutant type
-  const getColor = (pollutant) => {
-    switch (pollutant) {
-      case 'pm25':
-        return {
-          primary: '#00857c',
-          secondary: 'rgba(0, 133, 124, 0.2)'
-        };
-      case 'pm10':
-        return {
-          primary: '#0077c8',
-          secondary: 'rgba(0, 119, 200, 0.2)'
-        };
-      case 'no2':
-        return {
-          primary: '#3f9c35',
-          secondary: 'rgba(63, 156, 53, 0.2)'
-        };
-      case 'o3':
-        return {
-          primary: '#ffc72c',
-          secondary: 'rgba(255, 199, 44, 0.2)'
-        };
-      default:
-        return {
-          primary: '#00857c',
-          secondary: 'rgba(0, 133, 124, 0.2)'
-        };
+  const doughnutOptions = useMemo(() => ({
+    ...defaultOptions,
+    cutout: '70%',
+    plugins: {
+      ...defaultOptions.plugins,
+      legend: {
+        ...defaultOptions.plugins.legend,
+        position: 'bottom'
+      }
     }
-  };
-
-  // Get pollutant label
-  const getPollutantLabel = (pollutant) => {
-    switch (pollutant) {
-      case 'pm25':
-        return 'PM2.5 (μg/m³)';
-      case 'pm10':
-        return 'PM10 (μg/m³)';
-      case 'no2':
-        return 'NO₂ (μg/m³)';
-      case 'o3':
-        return 'O₃ (μg/m³)';
-      default:
-        return pollutant.toUpperCase();
-    }
-  };
+  }), [defaultOptions]);
 
   // Prepare data for Line Chart
   const prepareLineData = () => {
     const colors = getColor(pollutant);
     
     return {
-      labels: data.labels || Array(data.values.length).fill('').map((_, i) => `Point ${i+1}`),
+      labels: data.labels || Array.from({ length: data.values.length }, (_, i) => `Point ${i+1}`),
       datasets: [
         {
           label: getPollutantLabel(pollutant),
@@ -153,7 +165,7 @@ const AirQualityChart = ({ data, type = 'line', title, pollutant = 'pm25' }) =>
     const colors = getColor(pollutant);
     
     return {
-      labels: data.labels || Array(data.values.length).fill('').map((_, i) => `Point ${i+1}`),
+      labels: data.labels || Array.from({ length: data.values.length }, (_, i) => `Point ${i+1}`),
       datasets: [
         {
           label: getPollutantLabel(pollutant),
@@ -201,13 +213,7 @@ const AirQualityChart = ({ data, type = 'line', title, pollutant = 'pm25' }) =>
       datasets: [
         {
           data: Object.values(categories),
-          backgroundColor: [
-            '#3f9c35', // Good - Green
-            '#ffc72c', // Moderate - Yellow
-            '#ff9933', // Unhealthy for Sensitive - Orange
-            '#cc0033', // Unhealthy - Red
-            '#660099'  // Very Unhealthy - Purple
-          ],
+          backgroundColor: CATEGORY_COLORS,
           borderWidth: 0,
           hoverOffset: 4
         }
@@ -215,30 +221,35 @@ const AirQualityChart = ({ data, type = 'line', title, pollutant = 'pm25' }) =>
     };
   };
 
+  // Build the dataset for the active chart type only when its inputs change,
+  // so unrelated parent re-renders don't re-bucket every reading
+  const chartData = useMemo(() => {
+    if (!data || !data.values || data.values.length === 0) return null;
+
+    switch (type) {
+      case 'bar':
+        return prepareBarData();
+      case 'doughnut':
+        return prepareDoughnutData();
+      default:
+        return prepareLineData();
+    }
+  }, [data, type, pollutant]);
+
   // Render the appropriate chart based on type
   const renderChart = () => {
     switch (type) {
       case 'line':
-        return <Line data={prepareLineData()} options={defaultOptions} height={300} />;
+        return <Line data={chartData} options={defaultOptions} height={300} />;
       case 'bar':
-        return <Bar data={prepareBarData()} options={defaultOptions} height={300} />;
+        return <Bar data={chartData} options={defaultOptions} height={300} />;
       case 'doughnut':
         return (
           <div className="flex flex-col items-center">
             <div className="h-64 w-64">
               <Doughnut 
-                data={prepareDoughnutData()} 
-                options={{
-                  ...defaultOptions,
-                  cutout: '70%',
-                  plugins: {
-                    ...defaultOptions.plugins,
-                    legend: {
-                      ...defaultOptions.plugins.legend,
-                      position: 'bottom'
-                    }
-                  }
-                }} 
+                data={chartData} 
+                options={doughnutOptions} 
               />
             </div>
             <div className="mt-4 text-center">
@@ -247,12 +258,12 @@ const AirQualityChart = ({ data, type = 'line', title, pollutant = 'pm25' }) =>
           </div>
         );
       default:
-        return <Line data={prepareLineData()} options={defaultOptions} height={300} />;
+        return <Line data={chartData} options={defaultOptions} height={300} />;
     }
   };
 
   // Render a placeholder if no data is provided
-  if (!data || !data.values || data.values.length === 0) {
+  if (!chartData) {
     return (
       <div className="bg-white rounded-xl shadow-lg p-6 border-l-4 border-unep-primary h-80 flex flex-col items-center justify-center">
         <Activity className="w-12 h-12 text-unep-primary/30 mb-4" />
@@ -301,4 +312,5 @@ const AirQualityChart = ({ data, type = 'line', title, pollutant = 'pm25' }) =>
   );
 };
 
-export default AirQualityChart;
\ No newline at end of file
+// Charts only depend on their props; skip re-rendering when the dashboard updates unrelated state
+export default React.memo(AirQualityChart);
\ No newline at end of file
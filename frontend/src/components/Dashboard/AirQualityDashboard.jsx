@@ -1,10 +1,36 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useTransition, Suspense, lazy } from 'react';
 import { useData } from '../../context/DataContext';
 import { useSocket } from '../../context/SocketContext';
+import { useVisibleRefresh } from '../../hooks/useVisibleRefresh';
 import AirQualityChart from './AirQualityChart';
-import MapView from '../Map/MapView';
-import Analytics from '../Analytics/Analytics';
-import Alerts from '../Alerts/Alerts';
+import PageLoader from '../Common/PageLoader';
+
+// Only one tab is visible at a time; load the Leaflet and Recharts views on first use
+const MapView = lazy(() => import('../Map/MapView'));
+const Analytics = lazy(() => import('../Analytics/Analytics'));
+const Alerts = lazy(() => import('../Alerts/Alerts'));
+
+const AUTO_REFRESH_INTERVAL = 5 * 60 * 1000; // 5 minutes
+
+const getAQIColor = (aqi) => {
+  if (!aqi) return 'bg-gray-200';
+  if (aqi <= 50) return 'bg-green-500';
+  if (aqi <= 100) return 'bg-yellow-400';
+  if (aqi <= 150) return 'bg-orange-500';
+  if (aqi <= 200) return 'bg-red-500';
+  if (aqi <= 300) return 'bg-purple-600';
+  return 'bg-rose-900';
+};
+
+const getAQIText = (aqi) => {
+  if (!aqi) return 'Unknown';
+  if (aqi <= 50) return 'Good';
+  if (aqi <= 100) return 'Moderate';
+  if (aqi <= 150) return 'Unhealthy for Sensitive Groups';
+  if (aqi <= 200) return 'Unhealthy';
+  if (aqi <= 300) return 'Very Unhealthy';
+  return 'Hazardous';
+};
 
 const AirQualityDashboard = () => {
   const {
@@ -26,21 +52,18 @@ const AirQualityDashboard = () => {
   } = useSocket();
   
   const [activeTab, setActiveTab] = useState('dashboard');
+  const [isTabPending, startTabTransition] = useTransition();
   const [showMobileMenu, setShowMobileMenu] = useState(false);
   const [lastUpdated, setLastUpdated] = useState(new Date());
   
   useEffect(() => {
     // Initial data load
     refreshData();
-    
-    // Set up auto-refresh interval
-    const interval = setInterval(() => {
-      refreshSpecificData('dashboard');
-    }, 300000); // 5 minutes
-    
-    return () => clearInterval(interval);
   }, []);
   
+  // Auto-refresh while the tab is visible, catching up once when the user returns
+  useVisibleRefresh(() => refreshSpecificData('dashboard'), AUTO_REFRESH_INTERVAL);
+  
   useEffect(() => {
     if (socket) {
       // Listen for real-time data updates
@@ -70,6 +93,33 @@ const AirQualityDashboard = () => {
     }
   }, [socket]);
   
+  // Build both chart series in one pass, and only when measurements change, so the
+  // memoized charts keep receiving the same data objects between unrelated renders
+  const { pm25Series, pm10Series } = useMemo(() => {
+    const pm25 = { values: [], labels: [] };
+    const pm10 = { values: [], labels: [] };
+
+    measurements.forEach(m => {
+      const label = m.properties?.name || m.properties?.location || 'Unknown';
+      if (m.properties?.pm25) {
+        pm25.values.push(m.properties.pm25);
+        pm25.labels.push(label);
+      }
+      if (m.properties?.pm10) {
+        pm10.values.push(m.properties.pm10);
+        pm10.labels.push(label);
+      }
+    });
+
+    return { pm25Series: pm25, pm10Series: pm10 };
+  }, [measurements]);
+  
+  // Mounting the map or chart views is heavy; keep the tab click responsive and
+  // leave the current tab on screen until the next one is ready
+  const selectTab = (tab) => {
+    startTabTransition(() => setActiveTab(tab));
+  };
+  
   const handleRefresh = () => {
     refreshData();
     requestDataUpdate();
@@ -80,26 +130,6 @@ const AirQualityDashboard = () => {
     triggerAIAnalysis('comprehensive');
   };
   
-  const getAQIColor = (aqi) => {
-    if (!aqi) return 'bg-gray-200';
-    if (aqi <= 50) return 'bg-green-500';
-    if (aqi <= 100) return 'bg-yellow-400';
-    if (aqi <= 150) return 'bg-orange-500';
-    if (aqi <= 200) return 'bg-red-500';
-    if (aqi <= 300) return 'bg-purple-600';
-    return 'bg-rose-900';
-  };
-  
-  const getAQIText = (aqi) => {
-    if (!aqi) return 'Unknown';
-    if (aqi <= 50) return 'Good';
-    if (aqi <= 100) return 'Moderate';
-    if (aqi <= 150) return 'Unhealthy for Sensitive Groups';
-    if (aqi <= 200) return 'Unhealthy';
-    if (aqi <= 300) return 'Very Unhealthy';
-    return 'Hazardous';
-  };
-  
   return (
     <div className="min-h-screen bg-gradient-to-br from-unep-light/30 to-white">
       {/* Header */}
@@ -116,7 +146,7 @@ const AirQualityDashboard = () => {
               </div>
               <nav className="hidden sm:ml-6 sm:flex sm:space-x-8">
                 <button 
-                  onClick={() => setActiveTab('dashboard')}
+                  onClick={() => selectTab('dashboard')}
                   className={`${
                     activeTab === 'dashboard' 
                       ? 'border-unep-primary text-gray-900' 
@@ -126,7 +156,7 @@ const AirQualityDashboard = () => {
                   Dashboard
                 </button>
                 <button 
-                  onClick={() => setActiveTab('map')}
+                  onClick={() => selectTab('map')}
                   className={`${
                     activeTab === 'map' 
                       ? 'border-unep-primary text-gray-900' 
@@ -136,7 +166,7 @@ const AirQualityDashboard = () => {
                   Map View
                 </button>
                 <button 
-                  onClick={() => setActiveTab('analytics')}
+                  onClick={() => selectTab('analytics')}
                   className={`${
                     activeTab === 'analytics' 
                       ? 'border-unep-primary text-gray-900' 
@@ -146,7 +176,7 @@ const AirQualityDashboard = () => {
                   Analytics
                 </button>
                 <button 
-                  onClick={() => setActiveTab('alerts')}
+                  onClick={() => selectTab('alerts')}
                   className={`${
                     activeTab === 'alerts' 
                       ? 'border-unep-primary text-gray-900' 
@@ -189,7 +219,7 @@ const AirQualityDashboard = () => {
           <div className="pt-2 pb-3 space-y-1">
             <button
               onClick={() => {
-                setActiveTab('dashboard');
+                selectTab('dashboard');
                 setShowMobileMenu(false);
               }}
               className={`${
@@ -202,7 +232,7 @@ const AirQualityDashboard = () => {
             </button>
             <button
               onClick={() => {
-                setActiveTab('map');
+                selectTab('map');
                 setShowMobileMenu(false);
               }}
               className={`${
@@ -215,7 +245,7 @@ const AirQualityDashboard = () => {
             </button>
             <button
               onClick={() => {
-                setActiveTab('analytics');
+                selectTab('analytics');
                 setShowMobileMenu(false);
               }}
               className={`${
@@ -228,7 +258,7 @@ const AirQualityDashboard = () => {
             </button>
             <button
               onClick={() => {
-                setActiveTab('alerts');
+                selectTab('alerts');
                 setShowMobileMenu(false);
               }}
               className={`${
@@ -250,7 +280,7 @@ const AirQualityDashboard = () => {
 
       {/* Main Content */}
       <main className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
-        {loading && (
+        {(loading || isTabPending) && (
           <div className="fixed top-0 left-0 w-full h-1 z-50">
             <div className="bg-unep-primary h-full animate-pulse-slow"></div>
           </div>
@@ -365,10 +395,7 @@ const AirQualityDashboard = () => {
                 <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
                   {dashboardData?.air_quality?.pm25 && (
                     <AirQualityChart 
-                      data={{
-                        values: measurements.map(m => m.properties?.pm25).filter(Boolean),
-                        labels: measurements.map(m => m.properties?.location || 'Unknown').filter(Boolean)
-                      }}
+                      data={pm25Series}
                       type="line"
                       title="PM2.5 Levels"
                       pollutant="pm25"
@@ -377,10 +404,7 @@ const AirQualityDashboard = () => {
                   
                   {dashboardData?.air_quality?.pm10 && (
                     <AirQualityChart 
-                      data={{
-                        values: measurements.map(m => m.properties?.pm10).filter(Boolean),
-                        labels: measurements.map(m => m.properties?.location || 'Unknown').filter(Boolean)
-                      }}
+                      data={pm10Series}
                       type="bar"
                       title="PM10 Levels"
                       pollutant="pm10"
@@ -499,17 +523,19 @@ const AirQualityDashboard = () => {
           </div>
         )}
         
-        {activeTab === 'map' && (
-          <MapView />
-        )}
-        
-        {activeTab === 'analytics' && (
-          <Analytics />
-        )}
-        
-        {activeTab === 'alerts' && (
-          <Alerts />
-        )}
+        <Suspense fallback={<PageLoader />}>
+          {activeTab === 'map' && (
+            <MapView />
+          )}
+          
+          {activeTab === 'analytics' && (
+            <Analytics />
+          )}
+          
+          {activeTab === 'alerts' && (
+            <Alerts />
+          )}
+        </Suspense>
       </main>
 
       {/* Footer */}
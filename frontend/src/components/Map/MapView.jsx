@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useRef } from 'react';
+import React, { useState, useRef, useMemo } from 'react';
 import { MapContainer, TileLayer, Marker, Popup, CircleMarker, LayersControl, useMap, ZoomControl } from 'react-leaflet';
 // Note: We're using a custom heatmap implementation with CircleMarkers instead of react-leaflet-heatmap-layer
 import {
@@ -21,6 +21,7 @@ import {
 } from 'lucide-react';
 import { useData } from '../../context/DataContext';
 import { useSocket } from '../../context/SocketContext';
+import { useVisibleRefresh } from '../../hooks/useVisibleRefresh';
 import 'leaflet/dist/leaflet.css';
 import L from 'leaflet';
 import markerIcon2x from 'leaflet/dist/images/marker-icon-2x.png';
@@ -56,15 +57,11 @@ const MapView = () => {
   const nairobiCenter = [-1.2921, 36.8219];
   const mapBounds = [[-1.45, 36.65], [-1.15, 37.00]];
 
-  useEffect(() => {
-    // Auto-refresh data every 5 minutes
-    const interval = setInterval(() => {
-      if (mapLayers.measurements) refreshSpecificData('measurements');
-      if (mapLayers.hotspots) refreshSpecificData('hotspots');
-    }, 5 * 60 * 1000);
-
-    return () => clearInterval(interval);
-  }, [mapLayers, refreshSpecificData]);
+  // Auto-refresh data every 5 minutes while the map is actually visible
+  useVisibleRefresh(() => {
+    if (mapLayers.measurements) refreshSpecificData('measurements');
+    if (mapLayers.hotspots) refreshSpecificData('hotspots');
+  }, 5 * 60 * 1000);
 
   const getMarkerColor = (pm25Value) => {
     if (!pm25Value) return '#6b7280'; // gray
@@ -184,6 +181,10 @@ const MapView = () => {
     
     return data.filter(item => new Date(item.properties.timestamp) >= cutoff);
   };
+
+  // Filter each layer once per data/filter change; the heatmap and marker layers share the result
+  const filteredMeasurements = useMemo(() => getFilteredData(measurements), [measurements, timeFilter]);
+  const filteredHotspots = useMemo(() => getFilteredData(hotspots), [hotspots, timeFilter]);
   
   // Function to request AI analysis of hotspots
   const requestAIAnalysis = () => {
@@ -505,7 +506,7 @@ const MapView = () => {
                   {mapLayers.heatmap && (
                     <LayersControl.Overlay checked name="Pollution Heatmap">
                       <>
-                        {getFilteredData(measurements).map((measurement, index) => (
+                        {filteredMeasurements.map((measurement, index) => (
                           <CircleMarker
                             key={`heatmap-${index}`}
                             center={[
@@ -527,7 +528,7 @@ const MapView = () => {
                   {mapLayers.measurements && (
                     <LayersControl.Overlay checked name="Monitoring Stations">
                       <>
-                        {getFilteredData(measurements).map((measurement, index) => (
+                        {filteredMeasurements.map((measurement, index) => (
                           <CircleMarker
                             key={`measurement-${index}`}
                             center={[
@@ -589,7 +590,7 @@ const MapView = () => {
                   {mapLayers.hotspots && (
                     <LayersControl.Overlay checked name="Pollution Hotspots">
                       <>
-                        {getFilteredData(hotspots).map((hotspot, index) => (
+                        {filteredHotspots.map((hotspot, index) => (
                           <CircleMarker
                             key={`hotspot-${index}`}
                             center={[
@@ -1,4 +1,4 @@
-import React, { createContext, useContext, useReducer, useEffect } from 'react';
+import React, { createContext, useContext, useReducer, useEffect, useRef } from 'react';
 import { apiService } from '../services/apiService';
 import toast from 'react-hot-toast';
 
@@ -94,13 +94,35 @@ const dataReducer = (state, action) => {
 
 export const DataProvider = ({ children }) => {
   const [state, dispatch] = useReducer(dataReducer, initialState);
+  const inFlightLoad = useRef(null);
+  const reloadAfterCurrent = useRef(false);
 
   useEffect(() => {
     loadInitialData();
     setupRealtimeListeners();
   }, []);
 
-  const loadInitialData = async () => {
+  // Mount and manual refreshes can ask for a full load at once; share the in-flight one
+  // instead of stacking six parallel requests per caller. A forced load (the server
+  // invalidated its data) can't trust a load that may have started before the
+  // invalidation, so it schedules one more load after the current one finishes.
+  const loadInitialData = ({ force = false } = {}) => {
+    if (inFlightLoad.current) {
+      if (force) reloadAfterCurrent.current = true;
+      return inFlightLoad.current;
+    }
+
+    inFlightLoad.current = fetchAllData().finally(() => {
+      inFlightLoad.current = null;
+      if (reloadAfterCurrent.current) {
+        reloadAfterCurrent.current = false;
+        loadInitialData();
+      }
+    });
+    return inFlightLoad.current;
+  };
+
+  const fetchAllData = async () => {
     dispatch({ type: actionTypes.SET_LOADING, payload: true });
     
     try {
@@ -173,7 +195,7 @@ export const DataProvider = ({ children }) => {
 
     // Listen for data refresh
     window.addEventListener('dataRefreshed', () => {
-      loadInitialData();
+      loadInitialData({ force: true });
     });
 
     // Listen for AI analysis completion
@@ -0,0 +1,41 @@
+import { useEffect, useRef } from 'react';
+
+// Calls `refresh` every `interval` ms while the tab is visible. Hidden tabs stop the
+// timer; returning to a tab whose data is older than `interval` refreshes once and
+// restarts the schedule from there, so a catch-up is never followed by an early tick.
+export const useVisibleRefresh = (refresh, interval) => {
+  const refreshRef = useRef(refresh);
+  refreshRef.current = refresh;
+
+  useEffect(() => {
+    let lastRefresh = Date.now();
+    let timer = null;
+
+    const runRefresh = () => {
+      clearTimeout(timer);
+      lastRefresh = Date.now();
+      refreshRef.current();
+      timer = setTimeout(handleTimer, interval);
+    };
+
+    function handleTimer() {
+      timer = null;
+      // While hidden, wait for the visibilitychange catch-up instead of rescheduling
+      if (document.visibilityState === 'visible') runRefresh();
+    }
+
+    const handleVisibilityChange = () => {
+      if (document.visibilityState === 'visible' && Date.now() - lastRefresh >= interval) {
+        runRefresh();
+      }
+    };
+
+    timer = setTimeout(handleTimer, interval);
+    document.addEventListener('visibilitychange', handleVisibilityChange);
+
+    return () => {
+      clearTimeout(timer);
+      document.removeEventListener('visibilitychange', handleVisibilityChange);
+    };
+  }, [interval]);
+};
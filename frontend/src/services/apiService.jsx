@@ -98,6 +98,9 @@ export const apiService = {
   getCorrelations: (params = {}) => api.get('/analytics/correlations', { params }),
 };
 
+// Severity ranks for filtering, lowest to highest
+const SEVERITY_RANK = { low: 0, moderate: 1, high: 2, critical: 3 };
+
 // Utility functions for common operations
 export const dataUtils = {
   // Format API responses for components
@@ -196,12 +199,11 @@ export const dataUtils = {
   },
   
   filterBySeverity: (data, minSeverity = 'moderate') => {
-    const severityOrder = ['low', 'moderate', 'high', 'critical'];
-    const minIndex = severityOrder.indexOf(minSeverity);
+    const minIndex = SEVERITY_RANK[minSeverity] ?? -1;
     
     return data.filter(item => {
       const severity = item.properties?.severity || item.severity;
-      const itemIndex = severityOrder.indexOf(severity);
+      const itemIndex = SEVERITY_RANK[severity] ?? -1;
       return itemIndex >= minIndex;
     });
   },
@@ -6,6 +6,13 @@ class WAQIDataFetcher:
         self.token = token
         self.base_search_url = 'https://api.waqi.info/search/'
         self.base_feed_url = 'https://api.waqi.info/feed/'
+        # Search and feed hit the same host; reuse one keep-alive connection
+        self.session = requests.Session()
+    
+    def _describe_http_error(self, response):
+        # Error bodies are often HTML, so show a short raw excerpt instead of decoding JSON
+        snippet = response.content[:200].decode('utf-8', 'replace')
+        return f"{response.status_code} {response.reason} - {snippet}"
     
     def fetch_waqi_data(self, city='Nairobi'):
         if not self.token:
@@ -20,10 +27,13 @@ class WAQIDataFetcher:
             }
             
             print(f"🔍 Searching for stations in {city}...")
-            search_response = requests.get(self.base_search_url, params=search_params, timeout=8)
-            search_data = search_response.json()
+            search_response = self.session.get(self.base_search_url, params=search_params, timeout=8)
+            if search_response.status_code != 200:
+                print(f"❌ Search API error: {self._describe_http_error(search_response)}")
+                return []
             
-            if search_response.status_code != 200 or search_data.get('status') != 'ok':
+            search_data = search_response.json()
+            if search_data.get('status') != 'ok':
                 print(f"❌ Search API error: {search_data.get('message', 'Unknown error')}")
                 return []
             
@@ -45,10 +55,13 @@ class WAQIDataFetcher:
             feed_params = {'token': self.token}
             
             print(f"📡 Fetching data for station {station_id}...")
-            feed_response = requests.get(feed_url, params=feed_params, timeout=8)
-            feed_data = feed_response.json()
+            feed_response = self.session.get(feed_url, params=feed_params, timeout=8)
+            if feed_response.status_code != 200:
+                print(f"❌ Feed API error: {self._describe_http_error(feed_response)}")
+                return []
             
-            if feed_response.status_code != 200 or feed_data.get('status') != 'ok':
+            feed_data = feed_response.json()
+            if feed_data.get('status') != 'ok':
                 print(f"❌ Feed API error: {feed_data.get('message', 'Unknown error')}")
                 return []
             